@@ -226,6 +226,17 @@ TVM_DLL Pass BindSymbolicVars(ffi::Map<ffi::Variant<tir::Var, ffi::String>, Prim
  */
 TVM_DLL Pass FoldConstant();
 
+/*!
+ * \brief Canonicalize creation ops to their most specific form.
+ *
+ * Rewrites `full(shape, fill_value, dtype)` with a scalar-constant fill value
+ * of 0 or 1 into the dedicated `zeros(shape, dtype)` / `ones(shape, dtype)`
+ * ops, so downstream lowering can pick the specialized initialization path.
+ *
+ * \return The Pass.
+ */
+TVM_DLL Pass CanonicalizeCreateOps();
+
 /*!
  * \brief Legalize high-level operator calls in Relax functions to call_tir
  * with corresponding low-level TIR PrimFuncs.
@@ -0,0 +1,43 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Type stubs for the FFI endpoints registered under `relax.op`.
+
+The endpoints are injected at runtime by `tvm_ffi.init_ffi_api`, which type
+checkers cannot see.  Only the creation operators are declared explicitly so
+far; everything else falls through the module-level `__getattr__`.
+"""
+from typing import Any
+
+from ..expr import Expr
+
+def full(shape: Any, fill_value: Expr, dtype: Any) -> Expr: ...
+def full_like(x: Expr, fill_value: Expr, dtype: Any) -> Expr: ...
+def ones(shape: Expr, dtype: Any) -> Expr: ...
+def ones_like(x: Expr, dtype: Any) -> Expr: ...
+def zeros(shape: Expr, dtype: Any) -> Expr: ...
+def zeros_like(x: Expr, dtype: Any) -> Expr: ...
+def eye(n: Expr, m: Expr, k: Expr, dtype: Any) -> Expr: ...
+def eye_ints(n: int, m: int, k: int, dtype: Any) -> Expr: ...
+def eye_like(x: Expr, k: Expr, dtype: Any) -> Expr: ...
+def eye_like_int(x: Expr, k: int, dtype: Any) -> Expr: ...
+def arange(start: Expr, end: Expr, step: Expr, dtype: Any) -> Expr: ...
+def hamming_window(
+    window_size: Expr, periodic: Expr, alpha: Expr, beta: Expr, dtype: Any
+) -> Expr: ...
+def tril(x: Expr, k: Expr) -> Expr: ...
+def triu(x: Expr, k: Expr) -> Expr: ...
+def __getattr__(name: str) -> Any: ...
@@ -15,16 +15,133 @@
 # specific language governing permissions and limitations
 # under the License.
 """Creation operators."""
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 
-from tvm import DataType, DataTypeCode
+from tvm import DataType
 from tvm.ir.expr import PrimExpr
 
 from . import _ffi_api
 from ..expr import Expr, PrimValue, ShapeExpr
 
+__all__ = [
+    "arange",
+    "eye",
+    "eye_like",
+    "full",
+    "full_like",
+    "hamming_window",
+    "ones",
+    "ones_like",
+    "tril",
+    "triu",
+    "zeros",
+    "zeros_like",
+]
+
 PrimExprLike = Union[int, PrimExpr]
 
+# The wrappers below run once per emitted op, often millions of times while
+# building a large model, so bind their FFI endpoints to module-level names
+# once instead of paying an attribute lookup on `_ffi_api` per call.
+_full = _ffi_api.full
+_full_like = _ffi_api.full_like
+_ones = _ffi_api.ones
+_ones_like = _ffi_api.ones_like
+_zeros = _ffi_api.zeros
+_zeros_like = _ffi_api.zeros_like
+_eye = _ffi_api.eye
+_eye_ints = _ffi_api.eye_ints
+_eye_like = _ffi_api.eye_like
+_eye_like_int = _ffi_api.eye_like_int
+_arange = _ffi_api.arange
+_hamming_window = _ffi_api.hamming_window
+_tril = _ffi_api.tril
+_triu = _ffi_api.triu
+
+# Lazily bound to DataTypeCode.INT on first use; `tvm.DataTypeCode` is only
+# needed for arange's dtype inference, so its import is deferred out of the
+# module import path.
+_DT_INT: Optional[int] = None
+
+
+@lru_cache(maxsize=256)
+def _int_prim_value(value: int) -> PrimValue:
+    """Interned PrimValue node for a plain Python int.
+
+    PrimValue is immutable, so sharing one node across call sites is safe and
+    saves an FFI construction whenever the same small constant recurs (the
+    default `k=0`, `start=0` and `step=1` arguments below being the extreme
+    case).
+    """
+    return PrimValue(value)
+
+
+def _prim_value(value) -> PrimValue:
+    """Wrap `value` in a PrimValue, interning the plain-int case."""
+    if type(value) is int:
+        return _int_prim_value(value)
+    return PrimValue(value)
+
+
+def _wrap_k(k) -> Expr:
+    """Normalize a tril/triu diagonal offset to an Expr.
+
+    The plain-int check comes first since that is the overwhelmingly common
+    argument, letting the hot path skip the isinstance dispatch entirely.
+    """
+    if type(k) is int:
+        return _int_prim_value(k)
+    if isinstance(k, Expr):
+        return k
+    return PrimValue(k)
+
+
+@lru_cache(maxsize=64)
+def _dtype(dtype: Union[str, DataType]) -> DataType:
+    """Normalize a str dtype to DataType once, caching the parse result.
+
+    DataType is immutable, so handing the cached instance to every caller
+    is safe; this spares the FFI a string re-parse per constructor call.
+    """
+    return dtype if isinstance(dtype, DataType) else DataType(dtype)
+
+
+@lru_cache(maxsize=1024)
+def _shape_expr_int(shape: Tuple[int, ...]) -> ShapeExpr:
+    """Memoized ShapeExpr construction for all-int shape tuples.
+
+    Cached entries are shared IR nodes, which is safe since ShapeExpr is
+    immutable in Relax.
+    """
+    return ShapeExpr(shape)
+
+
+def _shape_expr(shape) -> ShapeExpr:
+    """Wrap a tuple/list shape in a ShapeExpr, memoizing the all-int case.
+
+    Shapes containing PrimExpr dimensions fall back to a fresh construction,
+    as symbolic dimensions are not safe to use as cache keys.
+    """
+    shape = tuple(shape)
+    if all(isinstance(s, int) for s in shape):
+        return _shape_expr_int(shape)
+    return ShapeExpr(shape)
+
+
+def _is_int_arg(expr) -> bool:
+    """Check whether an arange argument denotes an integer value."""
+    global _DT_INT  # pylint: disable=global-statement
+    if isinstance(expr, int):
+        return True
+    if isinstance(expr, PrimValue):
+        expr = expr.value
+    if _DT_INT is None:
+        from tvm import DataTypeCode  # pylint: disable=import-outside-toplevel
+
+        _DT_INT = DataTypeCode.INT
+    return isinstance(expr, PrimExpr) and DataType(expr.dtype).type_code == _DT_INT
+
 
 def full(
     shape: Union[Tuple[PrimExprLike], Expr],
@@ -50,7 +167,8 @@ def full(
     result : relax.Expr
         The result tensor.
     """
-    return _ffi_api.full(shape, fill_value, dtype)  # type: ignore
+    dtype = _dtype(dtype) if dtype is not None else None
+    return _full(shape, fill_value, dtype)
 
 
 def full_like(x: Expr, fill_value: Expr, dtype: Optional[Union[str, DataType]] = None) -> Expr:
@@ -76,7 +194,8 @@ def full_like(x: Expr, fill_value: Expr, dtype: Optional[Union[str, DataType]] =
     result : relax.Expr
         The result tensor.
     """
-    return _ffi_api.full_like(x, fill_value, dtype)  # type: ignore
+    dtype = _dtype(dtype) if dtype is not None else None
+    return _full_like(x, fill_value, dtype)
 
 
 def ones(shape: Union[Tuple[PrimExprLike], Expr], dtype: Union[str, DataType]) -> Expr:
@@ -95,9 +214,11 @@ def ones(shape: Union[Tuple[PrimExprLike], Expr], dtype: Union[str, DataType]) -
     result : relax.Expr
         The result tensor.
     """
-    if isinstance(shape, (tuple, list)):
-        shape = ShapeExpr(shape)
-    return _ffi_api.ones(shape, dtype)  # type: ignore
+    t = type(shape)
+    if t is tuple or t is list:
+        shape = _shape_expr(shape)
+    dtype = _dtype(dtype)
+    return _ones(shape, dtype)
 
 
 def ones_like(x: Expr, dtype: Optional[Union[str, DataType]] = None) -> Expr:
@@ -118,7 +239,8 @@ def ones_like(x: Expr, dtype: Optional[Union[str, DataType]] = None) -> Expr:
     result : relax.Expr
         The result tensor.
     """
-    return _ffi_api.ones_like(x, dtype)  # type: ignore
+    dtype = _dtype(dtype) if dtype is not None else None
+    return _ones_like(x, dtype)
 
 
 def zeros(shape: Union[Tuple[PrimExprLike], Expr], dtype: Union[str, DataType]) -> Expr:
@@ -137,9 +259,11 @@ def zeros(shape: Union[Tuple[PrimExprLike], Expr], dtype: Union[str, DataType])
     result : relax.Expr
         The result tensor.
     """
-    if isinstance(shape, (tuple, list)):
-        shape = ShapeExpr(shape)
-    return _ffi_api.zeros(shape, dtype)  # type: ignore
+    t = type(shape)
+    if t is tuple or t is list:
+        shape = _shape_expr(shape)
+    dtype = _dtype(dtype)
+    return _zeros(shape, dtype)
 
 
 def zeros_like(x: Expr, dtype: Optional[Union[str, DataType]] = None) -> Expr:
@@ -160,7 +284,8 @@ def zeros_like(x: Expr, dtype: Optional[Union[str, DataType]] = None) -> Expr:
     result : relax.Expr
         The result tensor.
     """
-    return _ffi_api.zeros_like(x, dtype)  # type: ignore
+    dtype = _dtype(dtype) if dtype is not None else None
+    return _zeros_like(x, dtype)
 
 
 def eye(
@@ -192,11 +317,17 @@ def eye(
     result : relax.Expr
         The result tensor.
     """
-    m = n if m is None else m
-    n = n if isinstance(n, PrimValue) else PrimValue(n)
-    m = m if isinstance(m, PrimValue) else PrimValue(m)
-    k = k if isinstance(k, PrimValue) else PrimValue(k)
-    return _ffi_api.eye(n, m, k, dtype)  # type: ignore
+    if type(n) is int and type(k) is int and (m is None or type(m) is int):
+        # Fast path for the common static case: the FFI side wraps the raw
+        # ints into PrimValues in a single call.
+        return _eye_ints(n, n if m is None else m, k, _dtype(dtype))
+    n = n if isinstance(n, PrimValue) else _prim_value(n)
+    # Reuse the wrapped `n` when `m` defaults to it, rather than wrapping the
+    # same value into a second PrimValue node.
+    m = n if m is None else (m if isinstance(m, PrimValue) else _prim_value(m))
+    k = k if isinstance(k, PrimValue) else _prim_value(k)
+    dtype = _dtype(dtype)
+    return _eye(n, m, k, dtype)
 
 
 def eye_like(
@@ -227,8 +358,11 @@ def eye_like(
     result : relax.Expr
         The result tensor.
     """
-    k = k if isinstance(k, PrimValue) else PrimValue(k)
-    return _ffi_api.eye_like(x, k, dtype)  # type: ignore
+    dtype = _dtype(dtype) if dtype is not None else None
+    if type(k) is int:
+        return _eye_like_int(x, k, dtype)
+    k = k if isinstance(k, PrimValue) else _prim_value(k)
+    return _eye_like(x, k, dtype)
 
 
 def arange(
@@ -263,24 +397,15 @@ def arange(
         end = start
         start = 0
 
-    def is_int(expr):
-        if isinstance(expr, int):
-            return True
-        if isinstance(expr, PrimValue):
-            expr = expr.value
-        return (
-            isinstance(expr, PrimExpr) and DataType(expr.dtype).type_code == DataTypeCode.INT
-        )  # type: ignore
-
     if dtype is None:
-        args = (start, end, step)
-        integer_args = all(is_int(arg) for arg in args)
+        integer_args = _is_int_arg(start) and _is_int_arg(end) and _is_int_arg(step)
         dtype = "int64" if integer_args else "float32"
 
-    start = start if isinstance(start, PrimValue) else PrimValue(start)
-    end = end if isinstance(end, PrimValue) else PrimValue(end)
-    step = step if isinstance(step, PrimValue) else PrimValue(step)
-    return _ffi_api.arange(start, end, step, dtype)  # type: ignore
+    start = start if isinstance(start, PrimValue) else _prim_value(start)
+    end = end if isinstance(end, PrimValue) else _prim_value(end)
+    step = step if isinstance(step, PrimValue) else _prim_value(step)
+    dtype = _dtype(dtype) if dtype is not None else None
+    return _arange(start, end, step, dtype)
 
 
 def hamming_window(window_size, periodic, alpha, beta, dtype):
@@ -306,16 +431,11 @@ def hamming_window(window_size, periodic, alpha, beta, dtype):
     ret : relax.Expr
         The result tensor.
     """
-    if not isinstance(window_size, Expr):
-        window_size = PrimValue(window_size)
-    if not isinstance(periodic, Expr):
-        periodic = PrimValue(periodic)
-    if not isinstance(alpha, Expr):
-        alpha = PrimValue(alpha)
-    if not isinstance(beta, Expr):
-        beta = PrimValue(beta)
-
-    return _ffi_api.hamming_window(window_size, periodic, alpha, beta, dtype)
+    window_size, periodic, alpha, beta = (
+        v if isinstance(v, Expr) else PrimValue(v) for v in (window_size, periodic, alpha, beta)
+    )
+    dtype = _dtype(dtype)
+    return _hamming_window(window_size, periodic, alpha, beta, dtype)
 
 
 def tril(x: Expr, k: Union[int, PrimExpr, Expr] = 0) -> Expr:
@@ -338,10 +458,7 @@ def tril(x: Expr, k: Union[int, PrimExpr, Expr] = 0) -> Expr:
     ret : relax.Expr
         The result tensor.
     """
-    if not isinstance(k, Expr):
-        k = PrimValue(k)
-
-    return _ffi_api.tril(x, k)  # type: ignore
+    return _tril(x, _wrap_k(k))
 
 
 def triu(x: Expr, k: Union[int, PrimExpr, Expr] = 0) -> Expr:
@@ -364,7 +481,4 @@ def triu(x: Expr, k: Union[int, PrimExpr, Expr] = 0) -> Expr:
     ret : relax.Expr
         The result tensor.
     """
-    if not isinstance(k, Expr):
-        k = PrimValue(k)
-
-    return _ffi_api.triu(x, k)  # type: ignore
+    return _triu(x, _wrap_k(k))
@@ -61,6 +61,7 @@ def zero_pipeline(*, enable_warning: bool = False):
         """
         seq = tvm.transform.Sequential(
             [
+                transform.CanonicalizeCreateOps(),
                 transform.LegalizeOps(enable_warning=enable_warning),
                 transform.AnnotateTIROpPattern(),
                 transform.FoldConstant(),
@@ -85,6 +86,7 @@ def default_build_pipeline():
             [
                 backend.DispatchSampling(),
                 backend.DispatchSortScan(),
+                transform.CanonicalizeCreateOps(),
                 transform.LegalizeOps(),
                 transform.RewriteDataflowReshape(),
                 transform.ToNonDataflow(),
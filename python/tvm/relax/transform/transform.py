@@ -462,6 +462,21 @@ def CanonicalizeBindings() -> tvm.ir.transform.Pass:
     return _ffi_api.CanonicalizeBindings()  # type: ignore
 
 
+def CanonicalizeCreateOps() -> tvm.ir.transform.Pass:
+    """Canonicalize creation ops to their most specific form.
+
+    Rewrites `full(shape, fill_value, dtype)` with a scalar-constant fill
+    value of 0 or 1 into the dedicated `zeros(shape, dtype)` /
+    `ones(shape, dtype)` ops, so downstream lowering can pick the specialized
+    initialization path for them.
+
+    Returns
+    -------
+    ret: tvm.ir.transform.Pass
+    """
+    return _ffi_api.CanonicalizeCreateOps()  # type: ignore
+
+
 def EliminateCommonSubexpr(call_only=False) -> FunctionPass:
     """Eliminate common subexpressions within functions.
 
@@ -253,6 +253,11 @@ Expr eye(PrimValue n, PrimValue m, PrimValue k, DataType dtype) {
   return Call(op, {std::move(n), std::move(m), std::move(k)}, Attrs(attrs), {});
 }
 
+Expr eye(int64_t n, int64_t m, int64_t k, DataType dtype) {
+  return eye(relax::PrimValue::Int64(n), relax::PrimValue::Int64(m), relax::PrimValue::Int64(k),
+             dtype);
+}
+
 Expr eye_like(Expr x, PrimValue k, ffi::Optional<DataType> dtype) {
   ObjectPtr<InitAttrs> attrs = ffi::make_object<InitAttrs>();
   attrs->dtype = dtype.value_or(DataType::Void());
@@ -260,9 +265,19 @@ Expr eye_like(Expr x, PrimValue k, ffi::Optional<DataType> dtype) {
   return Call(op, {std::move(x), std::move(k)}, Attrs(attrs), {});
 }
 
+Expr eye_like(Expr x, int64_t k, ffi::Optional<DataType> dtype) {
+  return eye_like(std::move(x), relax::PrimValue::Int64(k), std::move(dtype));
+}
+
 TVM_FFI_STATIC_INIT_BLOCK() {
   namespace refl = tvm::ffi::reflection;
-  refl::GlobalDef().def("relax.op.eye", eye).def("relax.op.eye_like", eye_like);
+  refl::GlobalDef()
+      .def("relax.op.eye", static_cast<Expr (*)(PrimValue, PrimValue, PrimValue, DataType)>(eye))
+      .def("relax.op.eye_ints", static_cast<Expr (*)(int64_t, int64_t, int64_t, DataType)>(eye))
+      .def("relax.op.eye_like",
+           static_cast<Expr (*)(Expr, PrimValue, ffi::Optional<DataType>)>(eye_like))
+      .def("relax.op.eye_like_int",
+           static_cast<Expr (*)(Expr, int64_t, ffi::Optional<DataType>)>(eye_like));
 }
 
 StructInfo InferStructInfoEye(const Call& call, const BlockBuilder& ctx) {
@@ -104,6 +104,16 @@ Expr zeros_like(Expr x, ffi::Optional<DataType> dtype);
  */
 Expr eye(PrimValue n, PrimValue m, PrimValue k, DataType dtype);
 
+/*!
+ * \brief Construct a 2-D tensor with ones on the diagonal and zeros elsewhere,
+ *        taking plain integers and wrapping them into PrimValue internally.
+ *
+ * This overload lets bindings pass raw ints through a single FFI call in the
+ * common static-shape case, instead of constructing three PrimValue objects
+ * up front.
+ */
+Expr eye(int64_t n, int64_t m, int64_t k, DataType dtype);
+
 /*!
  * \brief Construct a tensor with ones on the diagonal and zeros elsewhere,
  *        with shape and dtype similar to the input tensor.
@@ -117,6 +127,9 @@ Expr eye(PrimValue n, PrimValue m, PrimValue k, DataType dtype);
  */
 Expr eye_like(Expr x, PrimValue k, ffi::Optional<DataType> dtype);
 
+/*! \brief Overload of eye_like taking the diagonal index as a plain integer. */
+Expr eye_like(Expr x, int64_t k, ffi::Optional<DataType> dtype);
+
 /*! \brief Construct a tensor with evenly spaced elements. */
 Expr arange(PrimValue start, PrimValue stop, PrimValue step, DataType dtype);
 
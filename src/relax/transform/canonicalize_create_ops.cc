@@ -0,0 +1,137 @@
+/*
+ * Licensed to the Apache Software Foundation (ASF) under one
+ * or more contributor license agreements.  See the NOTICE file
+ * distributed with this work for additional information
+ * regarding copyright ownership.  The ASF licenses this file
+ * to you under the Apache License, Version 2.0 (the
+ * "License"); you may not use this file except in compliance
+ * with the License.  You may obtain a copy of the License at
+ *
+ *   http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing,
+ * software distributed under the License is distributed on an
+ * "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+ * KIND, either express or implied.  See the License for the
+ * specific language governing permissions and limitations
+ * under the License.
+ */
+
+/*!
+ * \file tvm/relax/transform/canonicalize_create_ops.cc
+ * \brief Rewrite `full(shape, 0, dtype)` to `zeros` and `full(shape, 1, dtype)` to `ones`
+ *
+ * User code often writes `R.full(shape, relax.const(0.0), dtype)` directly,
+ * which takes the generic fill path through lowering.  Routing such calls
+ * onto the dedicated `relax.zeros` / `relax.ones` ops lets downstream
+ * lowering pick the specialized initialization path for them.
+ */
+
+#include <tvm/ffi/reflection/registry.h>
+#include <tvm/relax/attrs/create.h>
+#include <tvm/relax/dataflow_matcher.h>
+#include <tvm/relax/expr.h>
+#include <tvm/relax/struct_info.h>
+#include <tvm/relax/transform.h>
+
+#include <optional>
+#include <tuple>
+
+#include "../op/tensor/create.h"
+
+namespace tvm {
+namespace relax {
+
+namespace {
+
+/*! \brief Read the value of a scalar constant, if its dtype is supported. */
+std::optional<double> GetScalarValue(const ConstantNode* constant) {
+  runtime::Tensor data = constant->data;
+  if (data->device.device_type != kDLCPU || !data.IsContiguous() || data->byte_offset != 0) {
+    return std::nullopt;
+  }
+  DataType dtype(data->dtype);
+  if (dtype.lanes() != 1) {
+    return std::nullopt;
+  }
+  if (dtype == DataType::Float(32)) {
+    return *static_cast<const float*>(data->data);
+  } else if (dtype == DataType::Float(64)) {
+    return *static_cast<const double*>(data->data);
+  } else if (dtype == DataType::Int(8)) {
+    return *static_cast<const int8_t*>(data->data);
+  } else if (dtype == DataType::Int(16)) {
+    return *static_cast<const int16_t*>(data->data);
+  } else if (dtype == DataType::Int(32)) {
+    return *static_cast<const int32_t*>(data->data);
+  } else if (dtype == DataType::Int(64)) {
+    return *static_cast<const int64_t*>(data->data);
+  } else if (dtype == DataType::UInt(8)) {
+    return *static_cast<const uint8_t*>(data->data);
+  } else if (dtype == DataType::UInt(16)) {
+    return *static_cast<const uint16_t*>(data->data);
+  } else if (dtype == DataType::UInt(32)) {
+    return *static_cast<const uint32_t*>(data->data);
+  } else if (dtype == DataType::UInt(64)) {
+    return static_cast<double>(*static_cast<const uint64_t*>(data->data));
+  } else if (dtype == DataType::Bool()) {
+    return *static_cast<const uint8_t*>(data->data);
+  }
+  return std::nullopt;
+}
+
+std::tuple<DFPattern, ffi::TypedFunction<Expr(Expr, ffi::Map<DFPattern, Expr>)>> CreatePatterns() {
+  auto pat_shape = WildcardPattern();
+  auto pat_fill_value = WildcardPattern();
+  auto pat_full = IsOp("relax.full")(pat_shape, pat_fill_value);
+
+  auto rewriter = [=](Expr expr, ffi::Map<DFPattern, Expr> matches) -> Expr {
+    const auto* constant = matches[pat_fill_value].as<ConstantNode>();
+    if (constant == nullptr || !constant->is_scalar()) {
+      return expr;
+    }
+
+    // Keep the generic path when the fill value is pinned to a virtual
+    // device, since zeros/ones would drop that placement.
+    if (const auto* sinfo = GetStructInfoAs<TensorStructInfoNode>(matches[pat_fill_value]);
+        sinfo != nullptr && sinfo->vdevice.defined()) {
+      return expr;
+    }
+
+    std::optional<double> value = GetScalarValue(constant);
+    if (!value.has_value() || (*value != 0.0 && *value != 1.0)) {
+      return expr;
+    }
+
+    const auto* call = expr.as<CallNode>();
+    ICHECK(call != nullptr);
+    const auto* attrs = call->attrs.as<InitAttrs>();
+    DataType dtype = attrs->dtype.is_void() ? DataType(constant->data->dtype) : attrs->dtype;
+
+    Expr shape = matches[pat_shape];
+    return *value == 0.0 ? zeros(shape, dtype) : ones(shape, dtype);
+  };
+
+  return {pat_full, rewriter};
+}
+
+}  // namespace
+
+namespace transform {
+
+Pass CanonicalizeCreateOps() {
+  auto pass_func = [=](Function func, IRModule mod, PassContext pc) {
+    auto [pattern, rewriter] = CreatePatterns();
+    return RewriteCall(pattern, rewriter, func);
+  };
+  return CreateFunctionPass(pass_func, 1, "CanonicalizeCreateOps", {});
+}
+
+TVM_FFI_STATIC_INIT_BLOCK() {
+  namespace refl = tvm::ffi::reflection;
+  refl::GlobalDef().def("relax.transform.CanonicalizeCreateOps", CanonicalizeCreateOps);
+}
+
+}  // namespace transform
+}  // namespace relax
+}  // namespace tvm
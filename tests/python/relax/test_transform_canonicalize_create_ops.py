@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import tvm.testing
+from tvm import relax
+from tvm.script import ir as I, relax as R
+
+
+class Base:
+    def test_compare(self):
+        transform = relax.transform.CanonicalizeCreateOps()
+        after = transform(self.Before)
+        tvm.ir.assert_structural_equal(self.Expected, after)
+
+
+class TestFullOfZeros(Base):
+    @I.ir_module
+    class Before:
+        @R.function
+        def main() -> R.Tensor([16, 32], "float32"):
+            out = R.full((16, 32), R.const(0.0, "float32"), dtype="float32")
+            return out
+
+    @I.ir_module
+    class Expected:
+        @R.function
+        def main() -> R.Tensor([16, 32], "float32"):
+            out = R.zeros((16, 32), dtype="float32")
+            return out
+
+
+class TestFullOfOnes(Base):
+    @I.ir_module
+    class Before:
+        @R.function
+        def main() -> R.Tensor([16, 32], "float32"):
+            out = R.full((16, 32), R.const(1.0, "float32"), dtype="float32")
+            return out
+
+    @I.ir_module
+    class Expected:
+        @R.function
+        def main() -> R.Tensor([16, 32], "float32"):
+            out = R.ones((16, 32), dtype="float32")
+            return out
+
+
+class TestFullOfZerosIntFillValue(Base):
+    """The rewrite keys on the fill value, not its dtype
+
+    An integer constant 0 filled into a float tensor is still a
+    zero-initialization.
+    """
+
+    @I.ir_module
+    class Before:
+        @R.function
+        def main() -> R.Tensor([16], "float16"):
+            out = R.full((16,), R.const(0, "int32"), dtype="float16")
+            return out
+
+    @I.ir_module
+    class Expected:
+        @R.function
+        def main() -> R.Tensor([16], "float16"):
+            out = R.zeros((16,), dtype="float16")
+            return out
+
+
+class TestNoRewriteOfGenericFillValue(Base):
+    """full with a fill value other than 0/1 is left alone"""
+
+    @I.ir_module
+    class Before:
+        @R.function
+        def main() -> R.Tensor([16, 32], "float32"):
+            out = R.full((16, 32), R.const(2.0, "float32"), dtype="float32")
+            return out
+
+    Expected = Before
+
+
+class TestNoRewriteOfDynamicFillValue(Base):
+    """full whose fill value is only known at runtime is left alone"""
+
+    @I.ir_module
+    class Before:
+        @R.function
+        def main(fill_value: R.Tensor([], "float32")) -> R.Tensor([16, 32], "float32"):
+            out = R.full((16, 32), fill_value, dtype="float32")
+            return out
+
+    Expected = Before
+
+
+if __name__ == "__main__":
+    tvm.testing.main()